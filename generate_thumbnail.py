@@ -1,19 +1,15 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from scipy.stats import gaussian_kde
+import hashlib
+import sys
+from pathlib import Path
 
-# ============================================================
-# Roughness kernel
-# ============================================================
-def roughness(delta_f, cbw=100):
-    x = delta_f / cbw
-    return np.exp(-3.5 * x) - np.exp(-5.75 * x)
+import numpy as np
 
 # ============================================================
 # Parameters
 # ============================================================
-f0 = 200.0
-partials = np.arange(1, 31)
+f0 = np.float32(200.0)
+partials = np.arange(1, 31, dtype=np.float32)
+n_grid = 600
 
 intervals = [
     ("Major third (5:4)", 5/4, "#ff6b6b"),
@@ -25,26 +21,80 @@ intervals = [
 # Reverse for display order (bottom to top)
 intervals = list(reversed(intervals))
 
+# ============================================================
+# Skip rendering when nothing has changed
+# ============================================================
+OUTPUT = Path("src/content/blog/musical-consonance-from-frequency-interactions/thumbnail.png")
+HASH_FILE = OUTPUT.with_name(OUTPUT.name + ".hash")
+
+# Parameters plus this script's source, so styling edits also invalidate the cache
+input_hash = hashlib.blake2b(repr((
+    f0,
+    tuple(partials.tolist()),
+    tuple((n, r, c) for n, r, c in intervals),
+    n_grid,
+)).encode() + Path(__file__).read_bytes()).hexdigest()
+
+if OUTPUT.exists() and HASH_FILE.exists() and HASH_FILE.read_text().strip() == input_hash:
+    print("Thumbnail up to date, skipping.")
+    sys.exit(0)
+
+import matplotlib
+matplotlib.use("Agg")  # headless: render straight to PNG, no GUI backend
+import matplotlib.pyplot as plt
+
+# ============================================================
+# Roughness kernel
+# ============================================================
+def roughness(delta_f, cbw=100):
+    x = delta_f / cbw
+    return np.exp(-3.5 * x) - np.exp(-5.75 * x)
+
+# ============================================================
+# Gaussian KDE (1-D, fixed bandwidth)
+# ============================================================
+def kde_eval(samples, weights, x, h):
+    d = (x[None, :] - samples[:, None]) / h
+    k = weights[:, None] * np.exp(-0.5 * d * d)
+    return k.sum(axis=0) / (h * np.float32(np.sqrt(2 * np.pi)))
+
+def kde1d(samples, x, bw):
+    # Same estimate as gaussian_kde(samples, bw_method=bw)(x), written out
+    # directly so the script does not need scipy.
+    samples = samples.astype(np.float32, copy=False)
+    h = np.float32(bw * samples.std(ddof=1))
+    # Many partial pairs land on the same Δf; sum each distinct value once, weighted
+    u, w = np.unique(samples.round(3), return_counts=True)
+    return kde_eval(u, w.astype(np.float32), x, h) / len(samples)
+
 # ============================================================
 # Create Panel C only - interaction density
 # ============================================================
-fig, ax = plt.subplots(figsize=(12, 6), facecolor='#000000')
+fig, ax = plt.subplots(figsize=(12, 6), facecolor='#000000', constrained_layout=True)
 
-fA = partials[:, None] * f0
-x = np.linspace(0, 200, 600)
+x = np.linspace(0, 200, n_grid, dtype=np.float32)
 r_curve = roughness(x)
 r_curve_max = r_curve.max()
 
-ys = []
+# All partial-pair differences for every interval at once: (n_intervals, 30 * 30)
+ratios = np.array([ratio for _, ratio, _ in intervals], dtype=np.float32)
+base = partials * f0
+fA = base[None, :, None]
+fB = base[None, None, :] * ratios[:, None, None]
+deltas = fA - fB
+np.abs(deltas, out=deltas)
+deltas = deltas.reshape(len(intervals), -1)  # contiguous, so a view rather than a copy
 
-for name, ratio, color in intervals:
-    fB = partials[None, :] * f0 * ratio
-    delta_vals = np.abs(fA - fB).flatten()
+def interval_density(delta_vals):
     delta_vals = delta_vals[delta_vals <= 200]
+    return kde1d(delta_vals, x, 0.035) * len(delta_vals)
+
+ys = [interval_density(delta_vals) for delta_vals in deltas]
+
+y_max = 0.0
 
-    kde = gaussian_kde(delta_vals, bw_method=0.035)
-    y = kde(x) * len(delta_vals)
-    ys.append(y)
+for (name, ratio, color), y in zip(intervals, ys):
+    y_max = max(y_max, y.max())
 
     ax.plot(x, y, linewidth=2.5, color=color, label=name)
 
@@ -53,7 +103,6 @@ for name, ratio, color in intervals:
     ax.axvline(delta_f_fund, linestyle=":", linewidth=1.5, color=color, alpha=0.5)
 
 # Add ear roughness sensitivity curve (scaled)
-y_max = max(np.max(y) for y in ys)
 ax.plot(
     x,
     r_curve / r_curve_max * y_max,
@@ -81,7 +130,6 @@ legend.get_frame().set_edgecolor('white')
 for text in legend.get_texts():
     text.set_color('white')
 
-plt.tight_layout()
-plt.savefig("src/content/blog/musical-consonance-from-frequency-interactions/thumbnail.png",
-            dpi=150, bbox_inches="tight", facecolor='#000000')
+plt.savefig(OUTPUT, dpi=150, facecolor='#000000')
+HASH_FILE.write_text(input_hash + "\n")
 print("Thumbnail saved!")
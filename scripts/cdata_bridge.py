@@ -12,14 +12,24 @@ Instead of reading Parquet files from cdata's storage, we:
 See: https://github.com/kenEldridge/cdata/issues/4
 """
 
-from datetime import datetime
+import asyncio
+import functools
+from collections import OrderedDict
+from operator import itemgetter
 from typing import Optional
+import numpy as np
 import pandas as pd
 
 from cdata.core.registry import get_registry
 from cdata.config.schema import SourceConfig
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_registry():
+    """Load the cdata registry once per process, shared by all bridges."""
+    return get_registry()
+
+
 class CDataBridge:
     """
     Bridge between the-derple-dex and cdata framework.
@@ -29,16 +39,22 @@ class CDataBridge:
     the-derple-dex application.
     """
 
-    def __init__(self):
-        """Initialize the bridge with lazy-loaded registry."""
-        self._registry = None
+    def __init__(self, cache_size: int = 0):
+        """
+        Initialize the bridge.
+
+        Args:
+            cache_size: Number of fetch results to memoize per bridge (least
+                        recently used are evicted). 0 disables caching, which
+                        suits callers that fetch each dataset only once.
+        """
+        self._cache_size = cache_size
+        self._fetch_cache = OrderedDict()
 
     @property
     def registry(self):
-        """Lazy-load the cdata registry on first access."""
-        if self._registry is None:
-            self._registry = get_registry()
-        return self._registry
+        """Lazy-load the shared cdata registry on first access."""
+        return _cached_registry()
 
     def _create_source_config(self, source_id: str, source_type: str, config: dict,
                              primary_keys: list, incremental: bool = False) -> SourceConfig:
@@ -103,15 +119,72 @@ class CDataBridge:
         if not result.records:
             return pd.DataFrame()
 
-        # Add metadata columns
-        data_rows = []
-        for record in result.records:
-            row = record.data.copy()
-            row['_source_id'] = source_id
-            row['_fetched_at'] = datetime.utcnow().isoformat()
-            data_rows.append(row)
+        # Build columns directly rather than copying each record into a row dict.
+        # Column order follows first appearance, matching pd.DataFrame(list_of_dicts).
+        rows = [record.data for record in result.records]
+        n = len(rows)
+        first_keys = rows[0].keys()
+        if all(row.keys() == first_keys for row in rows):
+            # Shared schema (the common case): pull each column out at C speed
+            data = {col: list(map(itemgetter(col), rows)) for col in first_keys}
+        else:
+            columns = dict.fromkeys(key for row in rows for key in row)
+            data = {col: [row.get(col) for row in rows] for col in columns}
+
+        # Add metadata columns; every row shares one source and one fetch time
+        fetched_at = pd.Timestamp.now(tz='UTC')
+        data['_source_id'] = pd.Categorical.from_codes(np.zeros(n, dtype=np.int8),
+                                                       categories=[source_id])
+        data['_fetched_at'] = pd.DatetimeIndex([fetched_at]).repeat(n)
+
+        return pd.DataFrame(data)
+
+    def _cached_fetch(self, key: tuple, **fetch_args) -> pd.DataFrame:
+        """
+        Memoize _fetch_with_config for this bridge instance, if caching is enabled.
+
+        Args:
+            key: Hashable form of the fetch arguments
+            **fetch_args: Keyword arguments passed to _fetch_with_config on a miss
+
+        Returns:
+            DataFrame with fetched data (a copy when served from the cache, so
+            callers cannot mutate it)
+        """
+        if self._cache_size <= 0:
+            return self._fetch_with_config(**fetch_args)
+
+        if key in self._fetch_cache:
+            self._fetch_cache.move_to_end(key)
+        else:
+            self._fetch_cache[key] = self._fetch_with_config(**fetch_args)
+            if len(self._fetch_cache) > self._cache_size:
+                self._fetch_cache.popitem(last=False)
+        return self._fetch_cache[key].copy()
+
+    def clear_cache(self):
+        """Drop this bridge's memoized fetch results."""
+        self._fetch_cache.clear()
+
+    async def fetch_many(self, specs: list) -> list:
+        """
+        Fetch several sources concurrently.
+
+        Each fetch runs _fetch_with_config in a worker thread, so network waits
+        overlap instead of adding up.
 
-        return pd.DataFrame(data_rows)
+        Args:
+            specs: List of dicts of _fetch_with_config keyword arguments
+                   (source_id, source_type, config, primary_keys, incremental)
+
+        Returns:
+            List of DataFrames, in the same order as specs
+        """
+        # Load the registry here so worker threads don't race to initialize it
+        self.registry
+        return await asyncio.gather(
+            *(asyncio.to_thread(self._fetch_with_config, **spec) for spec in specs)
+        )
 
     # ===================
     # YFINANCE (OHLCV)
@@ -131,7 +204,8 @@ class CDataBridge:
         Returns:
             DataFrame with columns: symbol, date, open, high, low, close, volume
         """
-        return self._fetch_with_config(
+        return self._cached_fetch(
+            ("yfinance", source_id, tuple(symbols), period, interval),
             source_id=source_id,
             source_type="yfinance",
             config={"symbols": symbols, "period": period, "interval": interval},
@@ -155,7 +229,8 @@ class CDataBridge:
             DataFrame with columns: feed_name, feed_url, title, link, summary,
                                    author, published, id
         """
-        return self._fetch_with_config(
+        return self._cached_fetch(
+            ("rss", source_id, tuple(tuple(feed.items()) for feed in feeds)),
             source_id=source_id,
             source_type="rss",
             config={"feeds": feeds},
@@ -177,7 +252,8 @@ class CDataBridge:
         Returns:
             DataFrame with columns: series_id, date, value, title, units, frequency
         """
-        return self._fetch_with_config(
+        return self._cached_fetch(
+            ("fred", source_id, tuple(series)),
             source_id=source_id,
             source_type="fred",
             config={"series": series},
@@ -200,7 +276,8 @@ class CDataBridge:
         Returns:
             DataFrame with columns: series_id, date, value, title, units, frequency
         """
-        return self._fetch_with_config(
+        return self._cached_fetch(
+            ("bls", source_id, tuple(series)),
             source_id=source_id,
             source_type="bls",
             config={"series": series},
@@ -223,7 +300,8 @@ class CDataBridge:
         Returns:
             DataFrame with call report data
         """
-        return self._fetch_with_config(
+        return self._cached_fetch(
+            ("ffiec", source_id, tuple(products)),
             source_id=source_id,
             source_type="ffiec",
             config={"products": products},
@@ -247,7 +325,8 @@ class CDataBridge:
         Returns:
             DataFrame with columns: year, table, date, variable, value, scenario
         """
-        return self._fetch_with_config(
+        return self._cached_fetch(
+            ("fed_stress", source_id, tuple(years), tuple(scenarios)),
             source_id=source_id,
             source_type="fed_stress",
             config={"years": years, "scenarios": scenarios},
@@ -266,6 +345,23 @@ def get_bridge() -> CDataBridge:
     return _bridge
 
 
+def clear_caches():
+    """Drop all memoized fetch results of the global bridge (e.g. between tests)."""
+    if _bridge is not None:
+        _bridge.clear_cache()
+
+
+def warmup():
+    """
+    Load the shared cdata registry ahead of the first fetch.
+
+    Only the registry itself is initialized; no source instances are created,
+    so nothing is fetched or written. Intended to run in a background thread
+    while the application starts up.
+    """
+    _cached_registry()
+
+
 # Convenience functions for direct use
 def fetch_data(source_id: str, source_type: str, config: dict,
               primary_keys: list, incremental: bool = False) -> pd.DataFrame: